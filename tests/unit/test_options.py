@@ -0,0 +1,55 @@
+# coding: utf-8
+
+import click
+
+from tmt.options import create_method_class
+
+# Methods sorted according to their priority
+TMT = click.Command('tmt')
+SHELL_TMT = click.Command('shell.tmt')
+SHELL = click.Command('shell')
+METHODS = {'tmt': TMT, 'shell.tmt': SHELL_TMT, 'shell': SHELL}
+
+
+def method(args, default=None):
+    """ Return method selected for given command line arguments """
+    command = create_method_class(METHODS)('step')
+    command._method = default
+    command._check_method(args)
+    return command._method
+
+
+def test_method_priority():
+    """ The first method by priority wins on a shared prefix """
+    assert method(['--how', 't']) is TMT
+    assert method(['--how', 'tm']) is TMT
+    assert method(['-h', 's']) is SHELL_TMT
+    assert method(['-h', 'shell']) is SHELL_TMT
+
+
+def test_method_empty_prefix():
+    """ Empty method name selects the first method """
+    assert method(['--how=']) is TMT
+    assert method(['-h', '']) is TMT
+
+
+def test_method_missing_value():
+    """ Option without value leaves the method unchanged """
+    assert method(['-h']) is None
+    assert method(['--how']) is None
+    assert method(['-v', '--how'], default=SHELL) is SHELL
+
+
+def test_method_unknown():
+    """ Unknown method prefix leaves the method unchanged """
+    assert method(['-hx']) is None
+    assert method(['--how', 'unknown'], default=SHELL) is SHELL
+    assert method(['--how=x'], default=SHELL) is SHELL
+
+
+def test_method_option_forms():
+    """ All forms of the option select the same method """
+    for args in [
+            ['-h', 'shell'], ['-hshell'], ['-h shell'],
+            ['--how', 'shell'], ['--how=shell']]:
+        assert method(args) is SHELL_TMT
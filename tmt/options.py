@@ -2,8 +2,6 @@
 
 """ Common options and the MethodCommand class """
 
-import re
-
 import click
 
 # Verbose, debug and quiet output
@@ -39,6 +37,13 @@ def create_method_class(methods):
     Methods should be already sorted according to their priority.
     """
 
+    # Map all method name prefixes to commands, the first method (with
+    # the highest priority) wins if more methods share the same prefix
+    prefixes = dict()
+    for name, command in methods.items():
+        for length in range(len(name) + 1):
+            prefixes.setdefault(name[:length], command)
+
     class MethodCommand(click.Command):
         _method = None
 
@@ -46,29 +51,26 @@ def create_method_class(methods):
             """ Manually parse the --how option """
             how = None
 
-            for index in range(len(args)):
+            args = iter(args)
+            for arg in args:
                 # Handle '--how method' or '-h method'
-                if args[index] in ['--how', '-h']:
-                    try:
-                        how = args[index + 1]
-                    except IndexError:
-                        pass
+                if arg in ['--how', '-h']:
+                    how = next(args, None)
                     break
                 # Handle '--how=method'
-                elif args[index].startswith('--how='):
-                    how = re.sub('^--how=', '', args[index])
+                elif arg.startswith('--how='):
+                    how = arg[len('--how='):]
                     break
                 # Handle '-hmethod'
-                elif args[index].startswith('-h'):
-                    how = re.sub('^-h ?', '', args[index])
+                elif arg.startswith('-h'):
+                    how = arg[2:]
+                    if how.startswith(' '):
+                        how = how[1:]
                     break
 
             # Find method with the first matching prefix
             if how is not None:
-                for method in methods:
-                    if method.startswith(how):
-                        self._method = methods[method]
-                        break
+                self._method = prefixes.get(how, self._method)
 
         def parse_args(self, context, args):
             self._check_method(args)
@@ -25,6 +25,12 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         tmt.steps.Method(name='beakerlib.tmt', doc=__doc__, order=80),
         ]
 
+    # Output settings, updated from the command line options in go()
+    _verbosity = 0
+    _progress_enabled = False
+    _progress_debug = False
+    _previous_progress_length = 0
+
     @classmethod
     def options(cls, how=None):
         """ Prepare command line options for given method """
@@ -61,31 +67,23 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         disabled using an option, just output the message as info without
         utilising \r. If finish is True, overwrite the previous progress bar.
         """
-        # Verbose mode outputs other information, using \r to
-        # create a status bar wouldn't work.
-        if self.opt('verbose'):
-            return
-
-        # No progress if terminal not attached or explicitly disabled
-        if not sys.stdout.isatty() or self.opt('no-progress-bar'):
+        # Verbose mode outputs other information, using \r to create a
+        # status bar wouldn't work. No progress if terminal not attached
+        # or explicitly disabled.
+        if not self._progress_enabled:
             return
 
         # For debug mode show just an info message (unless finishing)
         message = f"{test_name} [{progress}]" if not finish else ""
-        if self.opt('debug'):
+        if self._progress_debug:
             if not finish:
                 self.info(message, shift=1)
             return
 
-        # Show progress bar in an interactive shell.
-        try:
-            # We need to completely override the previous message, add
-            # spaces if necessary.
-            message = message.ljust(len(self._previous_progress_message))
-        except AttributeError:
-            # First iteration, previous message not set
-            pass
-        self._previous_progress_message = message
+        # Show progress bar in an interactive shell. We need to completely
+        # override the previous message, add spaces if necessary.
+        message = message.ljust(self._previous_progress_length)
+        self._previous_progress_length = len(message)
         message = self._indent('progress', message, color='cyan')
         sys.stdout.write(f"\r{message}")
         if finish:
@@ -110,8 +108,7 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         data_directory = self.data_path(test, full=True, create=True)
         environment = test.environment
         if test.framework == 'beakerlib':
-            environment = environment.copy()
-            environment['BEAKERLIB_DIR'] = data_directory
+            environment = dict(environment, BEAKERLIB_DIR=data_directory)
 
         # Prepare custom function to log output in verbose mode
         def log(key, value=None, color=None, shift=1, level=1):
@@ -134,11 +131,14 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
                 self.debug(f"Test duration '{test.duration}' exceeded.")
         end = time.time()
         self.write(
-            self.data_path(test, TEST_OUTPUT_FILENAME, full=True),
+            os.path.join(data_directory, TEST_OUTPUT_FILENAME),
             stdout or '', level=3)
         test.real_duration = self.test_duration(start, end)
-        duration = click.style(test.real_duration, fg='cyan')
-        shift = 1 if self.opt('verbose') < 2 else 2
+        # Colorize the duration only if the message is going to be shown
+        duration = test.real_duration
+        if self._verbosity:
+            duration = click.style(duration, fg='cyan')
+        shift = 1 if self._verbosity < 2 else 2
         self.verbose(
             f"{duration} {test.name} [{progress}]{timeout}", shift=shift)
 
@@ -155,6 +155,14 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         super().go()
         self._results = []
 
+        # Check output settings once, they do not change per test
+        self._verbosity = self.opt('verbose')
+        self._progress_enabled = (
+            sys.stdout.isatty() and not self._verbosity
+            and not self.opt('no-progress-bar'))
+        self._progress_debug = bool(self.opt('debug'))
+        self._previous_progress_length = 0
+
         # Nothing to do in dry mode
         if self.opt('dry'):
             self._results = []
@@ -166,8 +174,9 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
 
             # Push workdir to guest and execute tests
             guest.push()
+            total = len(tests)
             for index, test in enumerate(tests):
-                self.execute(test, guest, progress=f"{index + 1}/{len(tests)}")
+                self.execute(test, guest, progress=f"{index + 1}/{total}")
             # Overwrite the progress bar, the test data is irrelevant
             self._show_progress('', '', True)
 